@@ -1,21 +1,112 @@
+import itertools
 import logging
 import os
 import sys
+from functools import lru_cache
 
-from flask import Flask, render_template, request
+from flask import Flask, Response, jsonify, render_template, request
+from flask.json.provider import DefaultJSONProvider
+from jinja2 import FileSystemBytecodeCache
 
-from beauty_model_01 import predict_beauty_score
+try:
+    import orjson
+except ImportError:  # optional speed-up; Flask's stdlib json provider is used otherwise
+    orjson = None
+
+from beauty_model_01 import predict_beauty_score, predict_beauty_scores
 from mewati_model import MORPH_FEATURES, normalize_sentence
 
-# Configure logging
+SAMPLE_SENTENCES = list(itertools.islice(MORPH_FEATURES.keys(), 10))  # show a few examples
+
+# Configure logging; DEBUG only for the dev server, and skip the
+# caller/thread/process lookups that every log record would otherwise pay for.
+logging.logThreads = False
+logging.logProcesses = False
+logging._srcfile = None
 logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    level=logging.DEBUG if os.environ.get("FLASK_DEV") == "1" else logging.INFO,
+    format="%(levelname)s - %(name)s - %(message)s",
     stream=sys.stdout,
 )
 logger = logging.getLogger(__name__)
 
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson, honouring Flask's sort_keys/indent."""
+
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+if orjson is not None:
+    app.json = OrjsonProvider(app)
+
+# Cache compiled templates on disk, and skip the per-render mtime check
+# outside the dev server.
+app.config["TEMPLATES_AUTO_RELOAD"] = os.environ.get("FLASK_DEV") == "1"
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
+
+# /batch-predict is public; bound the work a single request can ask for.
+BATCH_MAX_ITEMS = 1000
+BATCH_MAX_CHARS = 10_000
+
+# Form fields longer than this skip the in-process caches, so the public form
+# cannot fill worker memory with large attacker-chosen keys.
+CACHE_MAX_INPUT_CHARS = 1024
+
+# Constant responses are built once instead of on every request.
+_HEALTH_RESP = Response(b"OK", status=200, mimetype="text/plain", direct_passthrough=True)
+
+
+def _health_fast_path(wsgi_app):
+    """Answer GET/HEAD /health probes before Flask's routing and request context."""
+
+    def middleware(environ, start_response):
+        if environ.get("PATH_INFO") == "/health" and environ.get("REQUEST_METHOD") in ("GET", "HEAD"):
+            return _HEALTH_RESP(environ, start_response)
+        return wsgi_app(environ, start_response)
+
+    return middleware
+
+
+app.wsgi_app = _health_fast_path(app.wsgi_app)
+
+
+@lru_cache(maxsize=2048)
+def _lookup_mewati(raw: str):
+    """Normalize raw input and fetch its morphological rows in one cached step.
+
+    Only called through the cache for inputs up to CACHE_MAX_INPUT_CHARS.
+    """
+    normalized = normalize_sentence(raw)
+    return normalized, (MORPH_FEATURES.get(normalized) if normalized else None)
+
+
+@lru_cache(maxsize=512)
+def _render_index(beauty_result, beauty_input, mewati_input, mewati_rows, mewati_error):
+    """Render the page once per distinct set of template arguments.
+
+    Bypassed while templates auto-reload (the dev server), so edits show up,
+    and for inputs over CACHE_MAX_INPUT_CHARS.
+    """
+    return render_template(
+        "index.html",
+        beauty_result=beauty_result,
+        beauty_input=beauty_input,
+        mewati_input=mewati_input,
+        mewati_rows=mewati_rows,
+        mewati_error=mewati_error,
+        sample_sentences=SAMPLE_SENTENCES,
+    )
 
 
 @app.route("/", methods=["GET", "POST"])
@@ -39,33 +130,59 @@ def home():
 
         elif form_id == "mewati":
             mewati_input = request.form.get("mewati_text", "").strip()
-            normalized = normalize_sentence(mewati_input)
+            lookup = (
+                _lookup_mewati
+                if len(mewati_input) <= CACHE_MAX_INPUT_CHARS
+                else _lookup_mewati.__wrapped__
+            )
+            normalized, mewati_rows = lookup(mewati_input)
             if normalized:
-                mewati_rows = MORPH_FEATURES.get(normalized)
                 if not mewati_rows:
                     mewati_error = f"No morphological features found for: {normalized}"
             else:
                 mewati_error = "Please enter a sentence."
 
-    sample_sentences = list(MORPH_FEATURES.keys())[:10]  # show a few examples
-
-    return render_template(
-        "index.html",
-        beauty_result=beauty_result,
-        beauty_input=beauty_input,
-        mewati_input=mewati_input,
-        mewati_rows=mewati_rows,
-        mewati_error=mewati_error,
-        sample_sentences=sample_sentences,
+    # Rows must be hashable to key the render cache.
+    cacheable = (
+        not app.config["TEMPLATES_AUTO_RELOAD"]
+        and len(beauty_input) <= CACHE_MAX_INPUT_CHARS
+        and len(mewati_input) <= CACHE_MAX_INPUT_CHARS
+    )
+    render = _render_index if cacheable else _render_index.__wrapped__
+    return render(
+        beauty_result,
+        beauty_input,
+        mewati_input,
+        tuple(mewati_rows) if mewati_rows else None,
+        mewati_error,
     )
 
 
+@app.route("/batch-predict", methods=["POST"])
+def batch_predict():
+    texts = request.get_json(silent=True)
+    if not isinstance(texts, list) or not all(isinstance(t, str) for t in texts):
+        return jsonify(error="Expected a JSON list of strings."), 400
+    if len(texts) > BATCH_MAX_ITEMS or any(len(t) > BATCH_MAX_CHARS for t in texts):
+        return jsonify(
+            error=f"At most {BATCH_MAX_ITEMS} texts of up to {BATCH_MAX_CHARS} characters each."
+        ), 413
+    return jsonify(predict_beauty_scores(texts))
+
+
 @app.route("/health")
 def health():
+    # GET/HEAD probes are answered by _health_fast_path before routing; this
+    # view keeps /health in the URL map and builds a fresh response, since the
+    # shared _HEALTH_RESP must never pass through Flask's response hooks.
     return "OK", 200
 
 
 if __name__ == "__main__":
-    port = int(os.environ.get("PORT", 8080))
-    logger.info(f"Starting app on port {port}")
-    app.run(host="0.0.0.0", port=port, debug=True)
+    # The Werkzeug dev server is single-threaded; production runs via gunicorn.
+    if os.environ.get("FLASK_DEV") == "1":
+        port = int(os.environ.get("PORT", 8080))
+        logger.info("Starting app on port %s", port)
+        app.run(host="0.0.0.0", port=port, debug=True)
+    else:
+        logger.info("Run with FLASK_DEV=1 for the dev server, or: gunicorn app:app -c gunicorn.conf.py")
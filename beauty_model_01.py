@@ -6,6 +6,15 @@ string instead of opening any GUI windows.
 """
 
 import re
+from functools import lru_cache
+
+_WS_RE = re.compile(r"\s+")
+# Byte -> 1 for ASCII vowels (either case), 0 otherwise; lets one C-level
+# translate + count replace a per-character Python loop.
+_VOWEL_TABLE = bytes(1 if chr(i) in "aeiouAEIOU" else 0 for i in range(256))
+# Longer texts are scored without memoizing, so the cache cannot hold
+# thousands of large user-supplied strings.
+_CACHE_MAX_CHARS = 1024
 
 
 def predict_beauty_score(text: str) -> str:
@@ -13,17 +22,32 @@ def predict_beauty_score(text: str) -> str:
 
     Replace this with your real model logic when ready. Keeping it tiny
     avoids loading the heavyweight Tkinter/nltk GUI during web requests.
+    The function is pure, so results for short texts are memoized for
+    repeat submissions.
     """
-    if not text:
+    if text and len(text) > _CACHE_MAX_CHARS:
+        return _score_text(text)
+    return _score_text_cached(text)
+
+
+def _score_text(text):
+    stripped = text.strip() if text else ""
+    if not stripped:
         return "Please enter some text."
 
     # Example heuristic: length and vowel ratio.
-    cleaned = re.sub(r"\s+", " ", text.strip())
+    cleaned = _WS_RE.sub(" ", stripped)
     length = len(cleaned)
-    vowels = sum(ch.lower() in "aeiou" for ch in cleaned)
-    vowel_ratio = (vowels / length) if length else 0
+    vowels = cleaned.encode("ascii", "ignore").translate(_VOWEL_TABLE).count(1)
+    vowel_ratio = vowels / length
     score = round((length % 10) + vowel_ratio * 5, 2)
 
     return f"Beauty Score for your text: {score}"
 
 
+_score_text_cached = lru_cache(maxsize=4096)(_score_text)
+
+
+def predict_beauty_scores(texts: list[str]) -> list[str]:
+    """Score a batch of texts; same output (and cache) as the per-text call."""
+    return [predict_beauty_score(t) for t in texts]
@@ -1,10 +1,15 @@
 import os
 
 bind = f"0.0.0.0:{os.environ.get('PORT', '8080')}"
-workers = 1
+workers = int(os.environ.get("WEB_CONCURRENCY", 4))
+worker_class = "gthread"
+threads = int(os.environ.get("GUNICORN_THREADS", 4))
+keepalive = 30
+# Import the app (and nltk via mewati_model) once in the master so forked
+# workers share those pages copy-on-write.
+preload_app = True
 timeout = 120
 accesslog = "-"
 errorlog = "-"
-loglevel = "debug"
+loglevel = "info"
 capture_output = True
-
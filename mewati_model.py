@@ -1,5 +1,12 @@
 # -*- coding: utf-8 -*-
+import json
+import os
 import re
+import sys
+import unicodedata
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from types import MappingProxyType
 
 # Tree is only needed for GUI tree rendering; keep optional for web use.
 try:
@@ -8,15 +15,32 @@ except Exception:  # pragma: no cover - fallback for environments without nltk/t
     Tree = None
 
 # -------- Helpers --------
+_PUNCT_TABLE = str.maketrans("", "", "۔؟!")  # sentence-final marks to drop
+_WS_RE = re.compile(r"\s+")
+_STYLE_CONFIGURED = False  # ttk styles are global per Tk interpreter; configure once
+_SHEET_MIN_ROWS = 200  # larger tables use tksheet (when installed) instead of ttk.Treeview
+_ROW_TAGS = ("thinborder",)
+_HEADER_ROW_TAGS = ("thinborder", "headerrow")
+
 def normalize_sentence(s: str) -> str:
     if not s:
         return ""
-    s = s.replace("۔", "").replace("؟", "").replace("!", "").strip()
-    s = re.sub(r"\s+", " ", s)
-    return s
+    s = unicodedata.normalize("NFC", s)
+    return _WS_RE.sub(" ", s.translate(_PUNCT_TABLE)).strip()
+
+def normalize_batch(seq) -> list[str]:
+    """normalize_sentence() over many sentences, with lookups hoisted out of the loop."""
+    nfc = unicodedata.normalize
+    table = _PUNCT_TABLE
+    sub = _WS_RE.sub
+    return [sub(" ", nfc("NFC", s).translate(table)).strip() if s else "" for s in seq]
 
 def show_table_popup(root, title: str, headers, rows, special_header_index=None):
-    """Compact popup table: thin borders, selectable, full-table copyable (with headers)."""
+    """Compact popup table: thin borders, selectable, full-table copyable (with headers).
+
+    Returns the popup's Toplevel.
+    """
+    global _STYLE_CONFIGURED
     import tkinter as tk
     from tkinter import ttk
 
@@ -28,37 +52,65 @@ def show_table_popup(root, title: str, headers, rows, special_header_index=None)
     frame = tk.Frame(top, bg="white", bd=1, relief="solid")
     frame.pack(fill="both", expand=True, padx=3, pady=3)
 
+    # --- Large tables: bulk-load into tksheet, which only draws visible cells ---
+    if len(rows) > _SHEET_MIN_ROWS:
+        try:
+            from tksheet import Sheet
+        except ImportError:  # optional GUI dependency; fall back to Treeview
+            Sheet = None
+        if Sheet is not None:
+            sheet = Sheet(frame, headers=list(headers), data=[list(r) for r in rows])
+            sheet.enable_bindings(("single_select", "drag_select", "select_all", "copy"))
+            if special_header_index is not None:
+                sheet.highlight_rows([special_header_index], bg="#e8f0fe")
+            sheet.pack(fill="both", expand=True)
+            return top
+
     # --- Style setup ---
     style = ttk.Style()
-    style.theme_use("default")
-    style.configure(
-        "Treeview",
-        background="white",
-        foreground="black",
-        rowheight=18,
-        fieldbackground="white",
-        borderwidth=0,
-        font=("Times New Roman", 10)
-    )
-    style.configure("Treeview.Heading", font=("Times New Roman", 10, "bold"), relief="flat")
-    style.layout("Treeview", [("Treeview.treearea", {"sticky": "nswe"})])  # Removes thick frame
+    if not _STYLE_CONFIGURED:
+        style.theme_use("default")  # restyles every widget; only needed once
+        style.configure(
+            "Treeview",
+            background="white",
+            foreground="black",
+            rowheight=18,
+            fieldbackground="white",
+            borderwidth=0,
+            font=("Times New Roman", 10)
+        )
+        style.configure("Treeview.Heading", font=("Times New Roman", 10, "bold"), relief="flat")
+        style.layout("Treeview", [("Treeview.treearea", {"sticky": "nswe"})])  # Removes thick frame
+        _STYLE_CONFIGURED = True
 
     # --- Treeview setup ---
     tree = ttk.Treeview(frame, columns=headers, show="headings", selectmode="extended")
 
-    for col in headers:
-        tree.heading(col, text=col, anchor="w")
-        max_width = max([len(str(r[headers.index(col)])) for r in rows] + [len(col)]) * 7
-        tree.column(col, width=max_width, anchor="w", stretch=False)
-
-    # Insert data rows
-    for idx, row in enumerate(rows):
-        if special_header_index is not None and idx == special_header_index:
-            tree.insert("", "end", values=row, tags=("headerrow",))
-        else:
-            tree.insert("", "end", values=row)
+    # Widest cell per column, gathered in one pass over the rows
+    col_max = [len(h) for h in headers]
+    for r in rows:
+        for i, v in enumerate(r):
+            n = len(v) if isinstance(v, str) else len(str(v))
+            if n > col_max[i]:
+                col_max[i] = n
+
+    heading, column = tree.heading, tree.column
+    for i, col in enumerate(headers):
+        heading(col, text=col, anchor="w")
+        column(col, width=col_max[i] * 7, anchor="w", stretch=False)
+
+    # Insert data rows; tags are configured first and the tree is only packed
+    # once it is fully populated, so Tk lays it out a single time.
     tree.tag_configure("headerrow", font=("Times New Roman", 10, "bold"))
+    tree.tag_configure("thinborder", background="white")  # thin border simulation
+    insert = tree.insert
+    for idx, row in enumerate(rows):
+        insert("", "end", values=row, tags=_HEADER_ROW_TAGS if idx == special_header_index else _ROW_TAGS)
 
+    # Vertical scrollbar, packed first so it keeps its column when the popup shrinks
+    scrollbar = ttk.Scrollbar(frame, orient="vertical", command=tree.yview)
+    tree.configure(yscrollcommand=scrollbar.set)
+    scrollbar.pack(side="right", fill="y")
     tree.pack(fill="both", expand=True, padx=1, pady=1)
 
     # --- Select All (Ctrl + A) ---
@@ -69,631 +121,220 @@ def show_table_popup(root, title: str, headers, rows, special_header_index=None)
     top.bind("<Control-a>", select_all)
 
     # --- Copy (Ctrl + C): copies selected rows with headers ---
+    header_line = "\t".join(headers)
+    all_rows_tsv = "\n".join([header_line] + ["\t".join(map(str, r)) for r in rows])
+
     def copy_selected(event=None):
         selected = tree.selection()
 
-        # Always start with headers
-        lines = ["\t".join(headers)]
-
         if selected:
-            # Add only selected rows
+            # Headers plus only the selected rows
+            lines = [header_line]
             for item in selected:
                 values = [str(v) for v in tree.item(item)["values"]]
                 lines.append("\t".join(values))
+            content = "\n".join(lines)
         else:
-            # Add all rows if none selected
-            for r in rows:
-                lines.append("\t".join(map(str, r)))
+            # Whole table, built once when the popup opened
+            content = all_rows_tsv
 
-        content = "\n".join(lines)
         top.clipboard_clear()
         top.clipboard_append(content)
         top.update()
         return "break"
 
     top.bind("<Control-c>", copy_selected)
+    return top
+
+
+# -------- Sentence Data --------
+# Morphological, SpaCy, Leipzig and X-Bar analyses live in mewati_data.json,
+# one record per sentence. It is read on first use rather than at import.
+_DATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "mewati_data.json")
+
+# Marker cells that recur throughout the tables ("unchanged", "same as Urdu",
+# "dialect variant"); every loaded row shares these objects.
+DASH = sys.intern("—")
+SAME = sys.intern("Same.")
+VARIANT = sys.intern("Variant.")
+_SENTINELS = {DASH: DASH, SAME: SAME, VARIANT: VARIANT}
+
+
+@dataclass(slots=True, frozen=True)
+class LeipzigEntry:
+    """Leipzig glossing of one sentence: translations plus per-word gloss rows."""
+    urdu: str
+    english: str
+    words: tuple
+
+
+@dataclass(slots=True, frozen=True)
+class SentenceEntry:
+    """All analyses for one sentence; a field is None when it has no data."""
+    morph: tuple | None = None
+    spacy: tuple | None = None
+    leipzig: LeipzigEntry | None = None
+    xbar: tuple | None = None  # alternative bracketed trees, preferred first
+
+
+def _freeze_rows(rows, intern_cols):
+    """Return rows as a tuple of tuples, interning short strings in ``intern_cols``."""
+    sentinel = _SENTINELS.get
+    def freeze_row(row):
+        values = [sentinel(v, v) for v in row]
+        for i in intern_cols:
+            v = values[i]
+            if isinstance(v, str) and len(v) < 32:
+                values[i] = sys.intern(v)
+        return tuple(values)
+    return tuple(freeze_row(r) for r in rows)
+
+
+def _build_sentences(records):
+    """Turn the raw JSON records into a read-only dict of SentenceEntry.
+
+    Keys go through normalize_sentence() (NFC, no final punctuation) and are
+    interned, so every analysis is reachable with the same normalized, interned
+    user input and key comparisons short-circuit on identity. Rows
+    become tuples and glosses become LeipzigEntry objects; POS tags,
+    dependency labels and short notes repeat across many rows, so those
+    columns share one object per distinct string.
+    """
+    sentences = {}
+    for key, record in records.items():
+        fields = {}
+        if "morph" in record:
+            fields["morph"] = _freeze_rows(record["morph"], (2, 3, 4))
+        if "spacy" in record:
+            fields["spacy"] = _freeze_rows(record["spacy"], (2, 3, 4))
+        if "leipzig" in record:
+            gloss = record["leipzig"]
+            fields["leipzig"] = LeipzigEntry(
+                urdu=gloss["urdu"],
+                english=gloss["english"],
+                words=_freeze_rows(gloss["words"], (1,)),
+            )
+        if "xbar" in record:
+            fields["xbar"] = tuple(record["xbar"])
+        sentences[sys.intern(normalize_sentence(key))] = SentenceEntry(**fields)
+    return MappingProxyType(sentences)
 
-    # --- Thin border simulation ---
-    def draw_thin_lines(event=None):
-        for item in tree.get_children():
-            tree.item(item, tags=("thinborder",))
-        tree.tag_configure("thinborder", background="white")
-
-    tree.bind("<Expose>", draw_thin_lines)
-
-
-# -------- Morphological Features --------
-MORPH_FEATURES = {
-    "جب ہماری کلاس لگے کرے ای": [
-        ("جب", "جب", "Subordinating Conjunction (Temporal)", "—", "Introduces time clauses."),
-        ("ہماری کلاس", "ہماری کلاس", "[ہم + اری] = Possessive Pronoun + Noun", "اری → ہماری", "Dialectal form of 'ہماری'."),
-        ("لگے", "لگتی", "[لگ + ے + کرے] = Root Verb + Aspect + Aux", "لگے کرے → لگتی", "Compound with habitual aspect."),
-        ("کرے ای", "تھی", "Copula/Aspect Marker (3rd fem past)", "ای → تھی", "Reduced form of 'تھی'."),
-    ],
-    "کہ او کتنو پختو لکھاری اے": [
-        ("کہ", "کہ", "Subordinating Conjunction", "—", "Same as Urdu."),
-        ("او", "وہ", "3rd Person Pronoun", "او → وہ", "Dialectal variation."),
-        ("کتنو پختو", "کتنا اچھا", "Interrogative + Adjective", "→ کتنا اچھا", "Equivalent phrase."),
-        ("لکھاری", "لکھاری", "Agent noun", "—", "Same as Urdu."),
-        ("اے", "ہے", "Copula", "اے → ہے", "Dialectal copula."),
-    ],
-    "اگر وے یا لباس اے پہری راکھاں": [
-        ("اگر", "اگر", "Conditional Conjunction", "—", "Identical."),
-        ("وے", "وہ", "Pronoun", "وے → وہ", "Mewati form."),
-        ("یا", "یہ/اس", "Demonstrative", "→ یہ/اس", "Dialectal."),
-        ("لباس اے", "لباس کو", "[Noun + Postposition]", "اے → کو", "Case marking difference."),
-        ("پہری راکھاں", "پہنتے ہیں", "Verb compound", "→ پہنتے ہیں", "Aspectual equivalence."),
-    ],
-    "گیانی اور تعلیم کا ماہر لوگن کو ای ماننواے": [
-        ("گیانی", "دانشور", "Noun", "—", "Borrowed word."),
-        ("اور", "اور", "Conjunction", "—", "Same."),
-        ("تعلیم کا ماہر", "تعلیم کے ماہر", "NP + Genitive", "کا → کے", "Case shift."),
-        ("لوگن کو", "لوگوں کو", "Plural Oblique + Dative", "ن → وں", "Plural form."),
-        ("ای", "یہ", "Demonstrative", "ای → یہ", "Variant."),
-        ("ماننواے", "ماننا ہے", "Root + Inf + Aux", "→ ماننا ہے", "Fusion."),
-    ],
-    "میرے مارے بی اب تک ایک اچھنبو سوای اے": [
-        ("میرے مارے", "میرے لیے", "Possessive + Postposition", "مارے → لیے", "Dialectal."),
-        ("بی", "بھی", "Particle", "→ بھی", "Colloquial."),
-        ("اب تک", "اب تک", "Temporal", "—", "Same."),
-        ("ایک", "ایک", "Numeral", "—", "Identical."),
-        ("اچھنبو سوای", "حیرانگی سی", "Adj + Postposition", "→ حیرانگی سی", "Lexical difference."),
-        ("اے", "ہے", "Copula", "→ ہے", "Variant."),
-    ],
-    "دنیا آ جا ری ہی": [
-        ("دنیا", "دنیا", "Noun", "—", "Same."),
-        ("آ", "آ", "Aspectual Prefix", "—", "Identical."),
-        ("جا ری", "جا رہی", "Verb Compound", "ری → رہی", "Phonemic reduction."),
-        ("ہی", "ہے", "Copula", "ہی → ہے", "Variant."),
-    ],
-    "کا ہم ماضی اے زندہ رکھ سکاں": [
-        ("کا", "کیا", "Question particle", "→ کیا", "Interrogative."),
-        ("ہم", "ہم", "1PL Pronoun", "—", "Same."),
-        ("ماضی اے", "ماضی کو", "Noun + Dative", "اے → کو", "Postpositional variant."),
-        ("زندہ", "زندہ", "Adjective", "—", "Same."),
-        ("رکھ", "رکھ", "Verb Root", "—", "Same."),
-        ("سکاں", "سکتے ہیں", "Modal Auxiliary", "→ سکتے ہیں", "Plural auxiliary."),
-    ],
-    "کہا میو روس میں باولا ہو گا": [
-        ("کہا", "کیا", "Interrogative", "→ کیا", "Variant."),
-        ("میو", "میو", "Ethnonym", "—", "Same."),
-        ("روس میں", "روس میں", "Noun + Locative", "—", "Same."),
-        ("باولا", "پاگل", "Adjective", "→ پاگل", "Equivalent meaning."),
-        ("ہو گا", "ہو گیا", "Auxiliary", "→ ہو گیا", "Tense/aspect difference."),
-    ],
-    "کہا پوچھو جائیگو قبر میں": [
-        ("کہا", "کیا", "Interrogative", "→ کیا", "Variant."),
-        ("پوچھو", "پوچھا", "Verb root", "→ پوچھا", "Dialectal form."),
-        ("جائیگو", "جائے گا", "Passive Future", "→ جائے گا", "Future passive."),
-        ("قبر میں", "قبر میں", "Noun + Locative", "—", "Same."),
-    ],
-    "اوکہن جا رو اے": [
-        ("او", "وہ", "Pronoun", "او → وہ", "Variant."),
-        ("کہن", "کہاں", "Interrogative Adverb", "کہن → کہاں", "Dialectal shift."),
-        ("جا رو", "جا رہا", "Verb compound", "رو → رہا", "Progressive."),
-        ("اے", "ہے", "Copula", "→ ہے", "Variant."),
-    ],
-    "تینے کہا کھایو": [
-        ("تینے", "تم نے", "2SG + ERG", "→ تم نے", "Case marking."),
-        ("کہا", "کیا", "Interrogative", "→ کیا", "Variant."),
-        ("کھایو", "کھایا", "Verb (perfective)", "یو → یا", "Perfective change."),
-    ],
-    "ہم رات کب سویا ہا": [
-        ("ہم", "ہم", "Pronoun", "—", "Same."),
-        ("رات", "رات", "Noun", "—", "Same."),
-        ("کب", "کب", "Interrogative", "—", "Same."),
-        ("سویا ہا", "سوئے تھے", "Verb + Aux", "ہا → تھے", "Aux difference."),
-    ],
-    "ای جاڑان کی بات ای": [
-        ("ای", "یہ", "Demonstrative", "→ یہ", "Variant."),
-        ("جاڑان کی", "جاڑوں کی", "Noun + Genitive", "ان → وں", "Plural suffix."),
-        ("بات", "بات", "Noun", "—", "Same."),
-        ("ای", "ہے", "Copula", "→ ہے", "Variant."),
-    ],
-    "او اچھو آدمی ہو": [
-        ("او", "وہ", "Pronoun", "او → وہ", "Dialectal."),
-        ("اچھو", "اچھا", "Adjective", "او → اا", "Phonological."),
-        ("آدمی", "آدمی", "Noun", "—", "Same."),
-        ("ہو", "تھا", "Copula", "→ تھا", "Tense difference."),
-    ],
-    "بیربانی بڑی ملوک ہی": [
-        ("بیربانی", "عورت", "Noun", "→ عورت", "Different lexeme."),
-        ("بڑی", "بہت", "Adverb", "→ بہت", "Intensifier shift."),
-        ("ملوک", "خوبصورت", "Adjective", "→ خوبصورت", "Semantic equivalent."),
-        ("ہی", "تھی", "Copula", "→ تھی", "Past tense copula."),
-    ],
-    "بوڑھی اماں نے کدی کائی کی برائی نہ کری": [
-        ("بوڑھی", "بوڑھی", "Adjective", "—", "Same."),
-        ("اماں", "ماں", "Noun", "→ ماں", "Dialectal variant."),
-        ("نے", "نے", "Ergative", "—", "Same."),
-        ("کدی", "کبھی", "Adverb", "→ کبھی", "Variant."),
-        ("کائی کی", "کسی کی", "Pronoun + Poss", "→ کسی کی", "Lexical."),
-        ("برائی", "برائی", "Noun", "—", "Same."),
-        ("نہ کری", "نہیں کی", "Neg + Verb", "→ نہیں کی", "Negation."),
-    ],
-    "میواتی زبان اپنی بقا کی جنگ لڑری اے": [
-        ("میواتی زبان", "میواتی زبان", "Proper noun phrase", "—", "Same."),
-        ("اپنی", "اپنی", "Possessive pronoun", "—", "Same."),
-        ("بقا کی جنگ", "بقا کی جنگ", "NP + Genitive", "—", "Same."),
-        ("لڑری", "لڑ رہی", "Verb Progressive", "ری → رہی", "Phonemic."),
-        ("اے", "ہے", "Copula", "→ ہے", "Variant."),
-    ],
-    "بزرگن کی بہت سی سنت ٹوٹتی دکھائی دے ری ہاں": [
-        ("بزرگن کی", "بزرگوں کی", "Plural + Gen", "ن → وں", "Plural ending."),
-        ("بہت سی", "بہت سی", "Quantifier", "—", "Same."),
-        ("سنت", "سنت", "Noun", "—", "Same."),
-        ("ٹوٹتی", "ٹوٹتی", "Verb progressive", "—", "Same."),
-        ("دکھائی دے", "دکھائی دے", "Light verb", "—", "Same."),
-        ("ری ہاں", "رہی ہیں", "Progressive + Copula", "ری ہاں → رہی ہیں", "Dialectal plural."),
-    ],
-    "گول مٹول سلونٹن سو بھر و چہرو": [
-        ("گول مٹول", "گول مٹول", "Adjective", "—", "Same."),
-        ("سلونٹن", "جھریاں", "Noun", "→ جھریاں", "Lexical substitution."),
-        ("سو", "سے", "Postposition", "→ سے", "Case marker."),
-        ("بھر و", "بھرا", "Verb participle", "→ بھرا", "Aspect."),
-        ("چہرو", "چہرہ", "Noun", "→ چہرہ", "Dialectal."),
-    ],
-    "کپڑا کی لوگڑی": [
-        ("کپڑا", "کپڑا", "Noun", "—", "Same."),
-        ("کی", "کا", "Genitive", "کی → کا", "Gender shift."),
-        ("لوگڑی", "دوپٹہ", "Noun", "→ دوپٹہ", "Lexical."),
-    ],
-    "یا کا منہ سو": [
-        ("یا", "یہ", "Demonstrative", "→ یہ", "Dialectal."),
-        ("کا", "کا", "Genitive", "—", "Same."),
-        ("منہ سو", "منہ سے", "Noun + Postposition", "سو → سے", "Postposition."),
-    ],
-}
-
-# -------- SpaCy Features --------
-SPACY_FEATURES = {
-    "جب ہماری کلاس لگے کرے ای": [
-        ["جب", "جب", "SCONJ", "mark", "Subordinating Conjunction (Temporal)", "کرے"],
-        ["ہماری", "ہم", "PRON", "nmod:poss", "Possessive Pronoun", "کلاس"],
-        ["کلاس", "کلاس", "NOUN", "nsubj", "Noun (subject of verb)", "کرے"],
-        ["لگے", "لگنا", "VERB", "aux", "Root Verb + Aspect + Aux", "کرے"],
-        ["کرے", "کرنا", "AUX", "root", "Habitual auxiliary verb", "—"],
-        ["ای", "ہونا", "AUX", "cop", "Reduced Copula form of تھی", "—"]
-    ],
-    "کہ او کتنو پختو لکھاری اے": [
-        ["کہ", "کہ", "SCONJ", "mark", "Subordinating Conjunction", "لکھاری"],
-        ["او", "وہ", "PRON", "nsubj", "3rd Person Pronoun", "لکھاری"],
-        ["کتنو", "کتنا", "ADJ", "amod", "Interrogative adjective", "پختو"],
-        ["پختو", "اچھا", "ADJ", "amod", "Quality adjective", "لکھاری"],
-        ["لکھاری", "لکھاری", "NOUN", "root", "Agent noun", "—"],
-        ["اے", "ہے", "AUX", "cop", "Copula (3rd person singular)", "لکھاری"]
-    ],
-    "اگر وے یا لباس اے پہری راکھاں": [
-        ["اگر", "اگر", "SCONJ", "mark", "Conditional conjunction", "راکھاں"],
-        ["وے", "وہ", "PRON", "nsubj", "3rd Person Pronoun", "راکھاں"],
-        ["یا", "یہ", "PRON", "det", "Demonstrative pronoun", "لباس"],
-        ["لباس", "لباس", "NOUN", "obj", "Noun", "راکھاں"],
-        ["اے", "کو", "ADP", "case", "Postposition marker", "لباس"],
-        ["پہری", "پہننا", "VERB", "aux", "Root verb + aspect", "راکھاں"],
-        ["راکھاں", "رکھنا", "AUX", "root", "Light verb + copula", "—"]
-    ],
-    "گیانی اور تعلیم کا ماہر لوگن کو ای ماننواے": [
-        ["گیانی", "دانشور", "NOUN", "compound", "Noun (agent)", "ماہر"],
-        ["اور", "اور", "CCONJ", "cc", "Coordinating conjunction", "گیانی"],
-        ["تعلیم", "تعلیم", "NOUN", "compound", "Part of NP", "ماہر"],
-        ["کا", "کا", "ADP", "case", "Genitive postposition", "تعلیم"],
-        ["ماہر", "ماہر", "NOUN", "nsubj", "Expert noun", "ماننواے"],
-        ["لوگن", "لوگ", "NOUN", "nmod", "Plural oblique", "ماننواے"],
-        ["کو", "کا", "ADP", "case", "Postposition", "لوگن"],
-        ["ای", "یہ", "PRON", "nsubj", "Demonstrative pronoun", "ماننواے"],
-        ["ماننواے", "ماننا ہے", "VERB", "root", "Infinitive + Aux", "—"],
-        ["اے", "ہے", "AUX", "cop", "Copula", "ماننواے"]
-    ],
-    "میرے مارے بی اب تک ایک اچھنبو سوای اے": [
-        ["میرے", "میرا", "PRON", "nmod:poss", "Possessive pronoun", "مارے"],
-        ["مارے", "لیے", "ADP", "case", "Postposition", "میرے"],
-        ["بی", "بھی", "PART", "advmod", "Focus/emphasis particle", "اے"],
-        ["اب تک", "اب تک", "ADV", "advmod", "Temporal phrase", "اے"],
-        ["ایک", "ایک", "NUM", "nummod", "Cardinal numeral", "سوای"],
-        ["اچھنبو", "عجیب", "ADJ", "amod", "Adjective", "سوای"],
-        ["سوای", "سی", "ADP", "obl", "Postposition", "اے"],
-        ["اے", "ہے", "AUX", "root", "Copula (present tense)", "—"]
-    ],
-    "دنیا آ جا ری ہی": [
-        ["دنیا", "دنیا", "NOUN", "nsubj", "Noun (subject)", "جاری"],
-        ["آ", "آنا", "PART", "aux", "Aspectual prefix", "جاری"],
-        ["جاری", "جا رہی", "VERB", "root", "Verb + progressive", "—"],
-        ["ہی", "ہے", "AUX", "cop", "Copula", "جاری"]
-    ],
-    "کا ہم ماضی اے زندہ رکھ سکاں": [
-        ["کا", "کیا", "PART", "aux", "Interrogative particle", "سکاں"],
-        ["ہم", "ہم", "PRON", "nsubj", "1PL pronoun", "سکاں"],
-        ["ماضی", "ماضی", "NOUN", "obj", "Noun (indirect object)", "رکھ"],
-        ["اے", "کو", "ADP", "case", "Postposition", "ماضی"],
-        ["زندہ", "زندہ", "ADJ", "amod", "Adjective (state)", "رکھ"],
-        ["زندہ رکھ", "زندہ رکھ", "VERB", "xcomp", "Compound verb", "سکاں"],
-        ["رکھ", "رکھتے", "VERB", "compound", "Root verb", "سکاں"],
-        ["سکاں", "سکتے ہیں", "AUX", "root", "Modal auxiliary", "—"]
-    ],
-    "کہا میو روس میں باولا ہو گا": [
-        ["کہا", "کیا", "PART", "aux", "Interrogative particle", "باولا"],
-        ["میو", "میو", "NOUN", "nsubj", "Ethnonym/proper noun", "باولا"],
-        ["روس میں", "روس میں", "PROPN", "obl", "Proper noun locative", "باولا"],
-        ["باولا", "پاگل", "ADJ", "amod", "Adjective", "میو"],
-        ["ہو گا", "ہو گیا", "AUX", "root", "Auxiliary tense/aspect", "—"]
-    ],
-    "کہا پوچھو جائیگو قبر میں": [
-        ["کہا", "کیا", "PART", "aux", "Interrogative particle", "پوچھو"],
-        ["پوچھو", "پوچھا", "VERB", "root", "Imperative verb", "—"],
-        ["جائیگو", "جائے گا", "VERB", "conj", "Future passive verb phrase", "پوچھو"],
-        ["قبر میں", "قبر میں", "NOUN", "obl", "Locative noun", "جائیگو"]
-    ],
-    "اوکہن جا رو اے": [
-        ["او", "وہ", "PRON", "nsubj", "3rd person pronoun", "جا رو"],
-        ["کہن", "کہاں", "ADV", "advmod", "Interrogative locative", "جا رو"],
-        ["جا رو", "جا رہا", "VERB", "root", "Verb compound: progressive", "—"],
-        ["اے", "ہے", "AUX", "aux", "Copula", "جا رو"]
-    ],
-    "تینے کہا کھایو": [
-        ["تینے", "تم نے", "PRON", "nsubj", "2SG pronoun + ergative", "کھایو"],
-        ["کہا", "کیا", "INTJ", "obj", "Interrogative pronoun", "کھایو"],
-        ["کھایو", "کھایا", "VERB", "root", "Perfective verb", "—"]
-    ],
-    "ہم رات کب سویا ہا": [
-        ["ہم", "ہم", "PRON", "nsubj", "1PL pronoun", "سویا ہا"],
-        ["رات", "رات", "NOUN", "nmod", "Temporal noun", "سویا ہا"],
-        ["کب", "کب", "ADV", "advmod", "Interrogative adverb", "سویا ہا"],
-        ["سویا ہا", "سوئے تھے", "VERB", "root", "Compound verb (past perfective)", "—"]
-    ],
-    "ای جاڑان کی بات ای": [
-        ["ای", "یہ", "PRON", "nsubj", "Demonstrative pronoun", "بات"],
-        ["جاڑان کی", "جاڑوں کی", "NOUN", "nmod", "Plural/Genitive noun", "بات"],
-        ["بات", "بات", "NOUN", "root", "Common noun", "—"],
-        ["ای", "ہے", "AUX", "cop", "Copula", "بات"]
-    ],
-    "او اچھو آدمی ہو": [
-        ["او", "وہ", "PRON", "nsubj", "3rd person pronoun", "آدمی"],
-        ["اچھو", "اچھا", "ADJ", "amod", "Adjective", "آدمی"],
-        ["آدمی", "آدمی", "NOUN", "root", "Common noun", "—"],
-        ["ہو", "تھا", "AUX", "cop", "Past copula", "آدمی"]
-    ],
-    "بیربانی بڑی ملوک ہی": [
-        ["بیربانی", "عورت", "NOUN", "nsubj", "Noun (feminine)", "ملوک"],
-        ["بڑی", "بہت", "ADV", "advmod", "Intensifier/adverb", "ملوک"],
-        ["ملوک", "خوبصورت", "ADJ", "amod", "Adjective", "بیربانی"],
-        ["ہی", "تھی", "AUX", "cop", "Past copula", "ملوک"]
-    ],
-    "بوڑھی اماں نے کدی کائی کی برائی نہ کری": [
-        ["بوڑھی", "بوڑھی", "ADJ", "amod", "Adjective", "اماں"],
-        ["اماں", "ماں", "NOUN", "nsubj", "Kinship noun", "کری"],
-        ["نے", "نے", "ADP", "case", "Ergative marker", "اماں"],
-        ["کدی", "کبھی", "ADV", "advmod", "Temporal adverb", "کری"],
-        ["کائی کی", "کسی کی", "PRON", "nmod:poss", "Possessive pronoun", "برائی"],
-        ["برائی", "برائی", "NOUN", "obj", "Abstract noun", "کری"],
-        ["نہ کری", "نہیں کی", "VERB", "ROOT", "Neg + Verb", "—"]
-    ],
-    "میواتی زبان اپنی بقا کی جنگ لڑری اے": [
-        ["میواتی زبان", "میواتی زبان", "PROPN", "compound", "Proper noun", "زبان"],
-        ["اپنی", "اپنی", "PRON", "poss", "Reflexive possessive", "بقا"],
-        ["بقا کی جنگ", "بقا کی جنگ", "NOUN", "nmod", "Abstract noun", "لڑری"],
-        ["لڑری", "لڑ رہی", "VERB", "root", "Verb + progressive participle", "—"],
-        ["اے", "ہے", "AUX", "cop", "Copula", "لڑری"]
-    ],
-    "بزرگن کی بہت سی سنت ٹوٹتی دکھائی دے ری ہاں": [
-        ["بزرگن کی", "بزرگوں کی", "NOUN", "nmod", "Plural + Genitive", "سنت"],
-        ["بہت سی", "بہت سی", "ADJ", "amod", "Quantifier", "سنت"],
-        ["سنت", "سنت", "NOUN", "nsubj", "Noun", "ٹوٹتی"],
-        ["ٹوٹتی", "ٹوٹتی", "VERB", "acl", "Verb progressive", "سنت"],
-        ["دکھائی دے", "دکھائی دے", "VERB", "xcomp", "Light verb", "ٹوٹتی"],
-        ["ری ہاں", "رہی ہیں", "AUX", "aux", "Progressive + Copula", "دکھائی دے"]
-    ],
-    "گول مٹول سلونٹن سو بھر و چہرو": [
-        ["گول مٹول", "گول مٹول", "ADJ", "amod", "Adjective", "چہرو"],
-        ["سلونٹن", "جھریاں", "NOUN", "amod", "Lexical substitution", "چہرو"],
-        ["سو بھر", "بھرا", "VERB", "amod", "Perfective participle", "چہرو"],
-        ["و", "ہوا", "AUX", "aux", "Aux/Copula", "سو بھر"],
-        ["چہرو", "چہرہ", "NOUN", "root", "Head noun", "—"]
-    ],
-    "کپڑا کی لوگڑی": [
-        ["کپڑا", "کپڑا", "NOUN", "nmod", "Noun", "لوگڑی"],
-        ["کی", "کا", "ADP", "case", "Genitive postposition", "کپڑا"],
-        ["لوگڑی", "دوپٹہ", "NOUN", "root", "Regional equivalent", "—"]
-    ],
-    "یا کا منہ سو": [
-        ["یا", "یہ", "PRON", "nmod", "Demonstrative pronoun", "منہ"],
-        ["کا", "کا", "ADP", "case", "Possessive postposition", "یا"],
-        ["منہ سو", "منہ سے", "NOUN", "obl", "Noun + Postposition", "سو"]
-    ]
-}
-
-# -------- Leipzig Glossing --------
-LEIPZIG_ENTRIES = {
-    "جب ہماری کلاس لگے کرے ای۔": {
-        "urdu": "جب ہماری کلاس لگتی تھی۔",
-        "english": "When our class used to take place.",
-        "words": [
-            ["جب", "SCONJ", "When"],
-            ["ہماری", "1SG.POSS", "Our"],
-            ["کلاس", "N", "Class"],
-            ["لگے", "V-root+ASP", "Root verb + aspect suffix"],
-            ["کرے", "V-root+HAB", "Habitual auxiliary"],
-            ["ای", "COP.PST.FEM", "Copula (past feminine)"]
-        ]
-    },
-    "کہ او کتنو پختو لکھار ی اے۔": {
-        "urdu": "کہ وہ کتنا اچھا لکھاری ہے۔",
-        "english": "That he is such a good writer.",
-        "words": [
-            ["کہ", "SCONJ", "That"],
-            ["او", "PRON.3SG", "He/She"],
-            ["کتنو پختو", "ADJ", "Good"],
-            ["لکھاری", "N-AGENT-NOM", "Writer"],
-            ["اے", "COP.PRES.3SG", "Is"]
-        ]
-    },
-    "اگر وےیا لباس اے پہری راکھاں۔": {
-        "urdu": "اگر وہ لباس کو پہنتے ہیں۔",
-        "english": "If he wears those clothes.",
-        "words": [
-            ["اگر", "SCONJ", "If"],
-            ["وے", "PRON.3SG", "He/She"],
-            ["یا", "DEM", "That"],
-            ["لباس اے", "N+DAT", "Clothes (dative)"],
-            ["پہری راکھاں", "V-root+ASP+HAB", "Wear (progressive+habitual)"]
-        ]
-    },
-    "گیانی اور تعلیم کا ماہر لوگن کو ای ماننواے اے۔": {
-        "urdu": "گیانی اور تعلیم کے ماہر لوگوں کو یہ ماننا ہے۔",
-        "english": "The people accept scholars and education experts.",
-        "words": [
-            ["گیانی", "N", "Scholar"],
-            ["اور", "CONJ", "And"],
-            ["تعلیم", "N", "Education"],
-            ["کا", "GEN", "Of"],
-            ["ماہر", "N", "Expert"],
-            ["لوگن کو", "N-PL+DAT", "People (dative)"],
-            ["ای", "DEM", "This"],
-            ["ماننواے", "V-root+INF+AUX", "To accept"],
-            ["اے", "COP.PRES.3SG", "Is"]
-        ]
-    },
-    "میرے مارے بی اب تک ایک اچھنبو سوای اے۔": {
-        "urdu": "میرے لیے بھی اب تک ایک حیرانگی سی ہے۔",
-        "english": "Even for me until now, there is a strange feeling.",
-        "words": [
-            ["میرے مارے", "1SG.POSS+POSTP", "For me"],
-            ["بی", "FOC-PARTICLE", "Also/even"],
-            ["اب تک", "ADV", "Until now"],
-            ["ایک", "NUM", "One"],
-            ["اچھنبو سوای", "ADJ+POSTP", "Strange like"],
-            ["اے", "COP.PRES.3SG", "Is"]
-        ]
-    },
-    "دنیا آ جا ری ہی۔": {
-        "urdu": "دنیا آ جا رہی ہے۔",
-        "english": "The world is coming and going.",
-        "words": [
-            ["دنیا", "N", "World"],
-            ["آ", "ASP-PREFIX", "Come"],
-            ["جا", "V-ROOT", "Go"],
-            ["ری", "PROG", "Progressive"],
-            ["ہی", "COP.PRES.3SG", "Is"]
-        ]
-    },
-    "کا ہم ماضی اے زندہ رکھ سکاں؟": {
-        "urdu": "کیا ہم ماضی کو زندہ رکھ سکتے ہیں؟",
-        "english": "Can we keep the past alive?",
-        "words": [
-            ["کا", "Q-PART", "Question"],
-            ["ہم", "PRON.1PL", "We"],
-            ["ماضی اے", "N+DAT", "Past (dative)"],
-            ["زندہ", "ADJ", "Alive"],
-            ["رکھ", "V-ROOT", "Keep"],
-            ["سکاں", "AUX-MOD.PL", "Can"]
-        ]
-    },
-    "کہا میو روس میں باولا ہو گا؟": {
-        "urdu": "کیا میواتی روس میں پاگل ہوگئے؟",
-        "english": "Have the Miwatis gone crazy in Russia?",
-        "words": [
-            ["کہا", "Q-PART", "Question"],
-            ["میو", "N", "Mewati"],
-            ["روس", "PROPN", "Russia"],
-            ["میں", "LOC", "In"],
-            ["باولا", "ADJ", "Crazy"],
-            ["ہو گا", "AUX.FUT.PL", "Will be"]
-        ]
-    },
-    "کہا پوچھو جائیگو قبر میں؟": {
-        "urdu": "کیا پوچھا جائے گا قبر میں؟",
-        "english": "Will it be asked in the grave?",
-        "words": [
-            ["کہا", "Q-PART", "What"],
-            ["پوچھو", "V-IMP", "Ask"],
-            ["جائیگو", "V-FUT-PASS", "Will be asked"],
-            ["قبر", "N", "Grave"],
-            ["میں", "LOC", "In"]
-        ]
-    },
-    "او کہن جا رو اے؟": {
-        "urdu": "وہ کہاں جا رہا ہے؟",
-        "english": "Where is he going?",
-        "words": [
-            ["او", "PRON.3SG", "He"],
-            ["کہن", "ADV-LOC", "Where"],
-            ["جا رو", "V-ROOT+PROG", "Going"],
-            ["اے", "COP.PRES.3SG", "Is"]
-        ]
-    },
-    "تینے کہا کھایو؟": {
-        "urdu": "تم نے کیا کھایا؟",
-        "english": "What did you eat?",
-        "words": [
-            ["تینے", "PRON.2SG+ERG", "You (ergative)"],
-            ["کہا", "Q-PART", "What"],
-            ["کھایو", "V-PFV", "Ate"]
-        ]
-    },
-    "ہم رات کب سویا ہا؟": {
-        "urdu": "ہم رات کب سوئے تھے؟",
-        "english": "When did we sleep at night?",
-        "words": [
-            ["ہم", "PRON.1PL", "We"],
-            ["رات", "N", "Night"],
-            ["کب", "ADV", "When"],
-            ["سویا ہا", "V-PFV+AUX", "Slept (past)"]
-        ]
-    },
-    "ای جاڑان کی بات ای۔": {
-        "urdu": "یہ جاڑوں کی بات ہے۔",
-        "english": "This is a matter of winters.",
-        "words": [
-            ["ای", "DEM", "This"],
-            ["جاڑان کی", "N-GEN", "Of winters"],
-            ["بات", "N", "Matter"],
-            ["ای", "COP.PRES", "Is"]
-        ]
-    },
-    "او اچھو آدمی ہو۔": {
-        "urdu": "وہ اچھا آدمی تھا۔",
-        "english": "He was a good man.",
-        "words": [
-            ["او", "PRON.3SG", "He"],
-            ["اچھو", "ADJ", "Good"],
-            ["آدمی", "N", "Man"],
-            ["ہو", "COP.PST.MASC", "Was"]
-        ]
-    },
-    "بیربانی بڑی ملوک ہی۔": {
-        "urdu": "عورت بہت خوبصورت تھی۔",
-        "english": "The woman was very beautiful.",
-        "words": [
-            ["بیربانی", "N", "Woman"],
-            ["بڑی", "ADV", "Very"],
-            ["ملوک", "ADJ", "Beautiful"],
-            ["ہی", "COP.PST.FEM", "Was (fem.)"]
-        ]
-    },
-    "بوڑھی اماں نے کدی کائی کی برائی نہ کری۔": {
-        "urdu": "بوڑھی اماں نے کبھی کسی کی برائی نہیں کی۔",
-        "english": "The old mother never did anyone any harm.",
-        "words": [
-            ["بوڑھی", "ADJ-FEM", "Old (fem.)"],
-            ["اماں", "N", "Mother"],
-            ["نے", "ERG", "Ergative"],
-            ["کدی", "ADV", "Ever"],
-            ["کائی کی", "PRON-POSS", "Someone’s"],
-            ["برائی", "N", "Evil"],
-            ["نہ", "NEG", "Not"],
-            ["کری", "V-PST.FEM", "Did (fem.)"]
-        ]
-    },
-    "میواتی زبان اپنی بقا کی جنگ لڑری اے۔": {
-        "urdu": "میواتی زبان اپنی بقا کی جنگ لڑ رہی ہے۔",
-        "english": "The Mewati language is fighting for its survival.",
-        "words": [
-            ["میواتی", "N-PROPN", "Mewati"],
-            ["زبان", "N", "Language"],
-            ["اپنی", "3SG.POSS", "Its"],
-            ["بقا", "N", "Survival"],
-            ["کی", "GEN", "Of"],
-            ["جنگ", "N", "War"],
-            ["لڑری", "V-root+PROG", "Fighting"],
-            ["اے", "COP.PRES", "Is"]
-        ]
-    },
-    "بزرگن کی بہت سی سنت ٹوٹتی دکھائی دے ری ہاں۔": {
-        "urdu": "بزرگوں کی بہت سی سنت بکھرتی دکھائی دے رہی ہیں۔",
-        "english": "Many traditions of the elders appear to be breaking.",
-        "words": [
-            ["بزرگن کی", "N-PL-GEN", "Of elders"],
-            ["بہت سی", "ADV+CLF", "Many"],
-            ["سنت", "N-PL", "Traditions"],
-            ["ٹوٹتی", "V-PROG-FEM", "Breaking"],
-            ["دکھائی دے", "V-light", "Appear"],
-            ["ری", "AUX-PROG-FEM", "Prog. fem."],
-            ["ہاں", "COP.PRES.PL", "Are"]
-        ]
-    },
-    "گول مٹول سلونٹن سو بھر و چہرو۔": {
-        "urdu": "گول مٹول جھریوں سے بھرا چہرہ۔",
-        "english": "A round face full of wrinkles.",
-        "words": [
-            ["گول مٹول", "ADJ", "Round"],
-            ["سلونٹن", "N-PL", "Wrinkles"],
-            ["سو", "POSTP", "From"],
-            ["بھر و", "V-PST", "Filled"],
-            ["چہرو", "N", "Face"]
-        ]
-    },
-    "کپڑا کی لوگڑی۔": {
-        "urdu": "کپڑے کا دوپٹہ۔",
-        "english": "Scarf made of cloth.",
-        "words": [
-            ["کپڑا", "N", "Cloth"],
-            ["کی", "GEN", "Of"],
-            ["لوگڑی", "N", "Scarf/Dupatta"]
-        ]
-    },
-    "یا کا منہ سو۔": {
-        "urdu": "اس کے منہ سے۔",
-        "english": "From his/her mouth.",
-        "words": [
-            ["یا", "DEM", "This/That"],
-            ["کا", "GEN", "Of"],
-            ["منہ سو", "N+POSTP", "Mouth+from"]
-        ]
-    }
-}
-
-
-# -------- X-Bar Structures --------
-XBAR_TREES = {
-    "جب ہماری کلاس لگے کرے ای۔": "[CP [C جب]\n    [TP [DP [D ہماری] [NP [N کلاس]]]\n       [T' \n            [VP [V   لگے کرے ای]][T Past]]]]",
-
-    "کہ او کتنو پختو لکھاری اے۔": "[CP [C کہ]\n    [TP [DP [D ∅] [NP او]]\n        [T'\n            [VP [DP [D ∅] [NP [AP کتنو پختو] [N' [N لکھاری]]]] [V اے]] [T ∅]]]]",
 
-    "اگر وے یا لباس اے پہری راکھاں۔": "[CP [C اگر]\n    [TP [DP [D ∅] [NP وے]]\n        [T' \n            [VP [DP [D یا] [NP [N لباس]]]\n                [V پہری راکھاں ]][T Present]]]]]",
+@lru_cache(maxsize=None)
+def _sentences():
+    with open(_DATA_PATH, encoding="utf-8") as f:
+        return _build_sentences(json.load(f))
 
-    "گیانی اور تعلیم کا ماہر لوگن کو ای ماننواے۔": "[TP\n   [DP \n      [DP \n         [NP [NP گیانی اور تعلیم] \n             [PP [P کا] [NP ماہر]]]]\n      [DP \n         [NP [NP لوگن] \n             [PP [P کو]]]]\n   ]\n\n   [T'\n      [VP \n         [V' [Dp ای] [V ماننواے]]]\n      [T Past]\n   ]\n]",
 
-    "میرے مارے بی اب تک ایک اچھنبو سوای اے۔": "[TP [DP [D ∅] [N میرے مارے بی]] [T' [VP [V' [AdvP اب تک] [V' [DP [D ایک] [NP [AP اچھنبو] [N' [N سوای]]]] [V اے]]]] [T Present]]]",
+@lru_cache(maxsize=None)
+def _facet(field):
+    """Read-only dict of one SentenceEntry field, shaped like the old per-analysis dicts.
 
-    "دنیا آ جا ری ہی۔": "[TP [DP [D ∅] [NP دنیا]]\n    [T'  [VP  [V آ][V   جا  ری  ]][T Past]]]",
+    Built once per field from _sentences(), so lookups are plain dict probes.
+    """
+    return MappingProxyType({
+        key: value
+        for key, entry in _sentences().items()
+        if (value := getattr(entry, field)) is not None
+    })
 
-    "کا ہم ماضی زندہ رکھ سکاں؟": "[CP [C کا] [TP [DP [D ∅] [NP ہم]] [T' [VP [DP [D اے] [NP ماضی]][V' [V زندہ رکھ سکاں] ]] [T ∅]]]]",
 
-    "کہا میو روس میں باولا ہو گا؟": "[CP [C کہا] [TP [DP [D ∅] [NP میو]] [T' [VP [V' [V باولا ہو گا]] [PP روس میں]] [T Past]]]]",
+@lru_cache(maxsize=None)
+def _sentence_re():
+    # Every known sentence in one alternation, longest first, so a single regex
+    # scan finds a known sentence embedded in longer input. The lookarounds
+    # only accept whole tokens, so a match never starts or ends inside a word.
+    alternation = "|".join(map(re.escape, sorted(_sentences(), key=len, reverse=True)))
+    return re.compile(rf"(?<!\S)(?:{alternation})(?!\S)")
 
-    "کہا پوچھو جائیگو قبر میں؟": "[CP [C کہا] [TP [DP ∅] [T' [VP [V' [V پوچھو جائیگو]] [PP قبر میں]] [T Future]]]]",
 
-    "اوکہن جا رو اے؟": "[CP [DP [D ∅] [N او]] [C' [C کہن] [TP [DP ∅] [T' [AuxP  [VP [V جا]] [Aux رواے ]] [T Prog]]]]]\n\n[CP [Spec [DP [D ∅] [N او]]] [C' [C کہن] [TP [Spec [DP ∅]] [T' [T Prog] [AuxP [Aux' [Aux رواے] [VP [V' [V جا]]]]]]]]]",
+def _match_sentence(sent):
+    """Resolve an already-normalized sentence to ``(known key, entry)``.
 
-    "تینے کہا کھایو؟": "[TP [DP [D ∅] [NP تینے]]\n    [T' [T ∅]\n        [VP [DP [D ∅] [NP کہا]] [V کھایو]]]]",
+    Returns ``(None, None)`` when no known sentence matches.
+    """
+    sentences = _sentences()
+    entry = sentences.get(sent)
+    if entry is not None:
+        return sent, entry
+    if sent:
+        match = _sentence_re().search(sent)
+        if match:
+            key = sys.intern(match.group())  # the interned SENTENCES key
+            return key, sentences[key]
+    return None, None
 
-    "ہم رات کب سویا ہا؟": "[CP [C کب]\n    [TP [DP [D ∅] [NP ہم]]\n        [T' [T ہا]\n            [VP [AdvP رات] [V سویا]]]]]",
 
-    "ای جاڑان کی بات ای۔": "[TP [Spec [DP [D ∅] [N ای]]] [T' [T ∅] [VP [V' [DP [D ∅] [NP [NP جاڑان] [PP [P کی] [NP بات]]]] [V ای]]]]]",
+def lookup(user_input: str) -> SentenceEntry | None:
+    """Return all analyses for a user-typed sentence, or None if it is unknown.
 
-    "او اچھو آدمی ہو۔": "[TP [Spec [DP [D ∅] [N او]]] [T'  [VP [V'  [DP [D ∅] [NP [AP اچھو] [N آدمی]]][V ہو]]][T ∅]]]",
+    An exact match wins; otherwise the first known sentence found inside the
+    input as a run of whole words is used.
+    """
+    return _match_sentence(normalize_sentence(user_input))[1]
 
-    "بیربانی بڑی ملوک ہی۔": "[TP [Spec [DP [D ∅] [NP بیربانی]]] [T'  [VP [V' [AP [A' [DegP بڑی] [A ملوک]]] [V ہی]]][T ∅]]]",
 
-    "بوڑھی اماں نے کدی کائی کی برائی نہ کری۔": "[TP [Spec [DP [D ∅] [NP [AP بوڑھی] [N' [N اماں] [CaseP [Case نے]]]]]] [T'  [VP [AdvP کدی] [V' [DP [D ∅] [N کائی]] [V' [NP [N'  [PP [P کی] [NP ∅]]][N برائی]] [V' [AdvP نہ] [V کری]]]]][T Perf]]]",
+def _parse_xbar(variants):
+    """Parse the first well-formed variant of a sentence's X-Bar trees."""
+    for src in variants:
+        try:
+            return Tree.fromstring(src, brackets="[]")
+        except ValueError:
+            continue
+    return None  # malformed source; the tree view falls back to build_xbar_tree()
+
+
+@lru_cache(maxsize=256)
+def _parsed_xbar_tree(sent):
+    """Parsed X-Bar tree for a normalized sentence, parsed on first request only."""
+    variants = _facet("xbar").get(sent)
+    if variants is None or Tree is None:
+        return None
+    return _parse_xbar(variants)
+
+
+def _xbar_trees_parsed():
+    parsed = {}
+    for key in _facet("xbar"):
+        tree = _parsed_xbar_tree(key)
+        if tree is not None:
+            parsed[key] = tree
+    return parsed
+
+
+_LAZY_ATTRS = {
+    "SENTENCES": _sentences,
+    "MORPH_FEATURES": partial(_facet, "morph"),
+    "SPACY_FEATURES": partial(_facet, "spacy"),
+    "LEIPZIG_ENTRIES": partial(_facet, "leipzig"),
+    "XBAR_TREES": partial(_facet, "xbar"),
+    "XBAR_TREES_PARSED": _xbar_trees_parsed,
+}
 
-    "میواتی زبان اپنی بقا کی جنگ لڑری اے۔": "[TP [DP [D ∅] [NP [AP میواتی] [N' [N زبان]]]]\n    [T' [T اے]\n        [VP [DP [D ∅] [NP [NP اپنی بقا] [PP [P کی] [NP جنگ]]]] [V لڑری]]]]",
 
-    "بزرگن کی بہت سی سنت ٹوٹتی دکھائی دے ری ہاں۔": "[TP [DP [D ∅] [NP [NP بزرگن] [PP [P کی] [NP [AP بہت سی] [N' [N سنت]]]]]]\n    [T' [T ہاں]\n        [VP [V' [V ٹوٹتی]\n            [V' [V دکھائی]\n                [V' [V دے]\n                    [V' [V ری] [V ∅]]]]]]]]",
+def __getattr__(name):
+    # PEP 562: build the data tables on first access from outside the module.
+    if name in _LAZY_ATTRS:
+        value = globals()[name] = _LAZY_ATTRS[name]()
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-    "گول مٹول سلونٹن سو بھر و چہرو۔": "[TP [Spec [DP [D ∅] [NP [AP گول مٹول] [N' [AP سلونٹن سو بھر و] [N' [N چہرو]]]]]] [T' [T ∅] [VP ∅]]]",
 
-    "کپڑا کی لوگڑی۔": "[TP [DP [D ∅] [NP [N' [N کپڑا] [PP [P کی] [NP [N لوگڑی]]]]]] [T' [T ∅] [VP ∅]]]",
+# Shared fallback tree for blank input when nltk.tree is unavailable
+_EMPTY_TREE = ("TP", ("—",))
 
-    "یا کا منہ سو۔": "[TP [DP [D یا کا] [NP [N' [N منہ] [PP [P سو]]]]] [T' [T ∅] [VP ∅]]]"
-}
 
+@lru_cache(maxsize=256)
+def build_xbar_tree(tokens: tuple):
+    """Create a simple X-Bar style tree; falls back if nltk Tree is missing.
 
-def build_xbar_tree(tokens):
-    """Create a simple X-Bar style tree; falls back if nltk Tree is missing."""
-    if not tokens:
-        tokens = ["—"]
+    Cached per token tuple; TreeWidget only reads the tree, so callers share it.
+    """
     if Tree is None:
-        return ["TP", tokens]  # lightweight fallback when nltk.tree is unavailable
+        # lightweight fallback when nltk.tree is unavailable
+        return ("TP", tokens) if tokens else _EMPTY_TREE
+    if not tokens:
+        tokens = ("—",)
     return Tree("TP", [
         Tree("DP", [tokens[0]]),
         Tree("T'", [
@@ -703,11 +344,41 @@ def build_xbar_tree(tokens):
     ])
 
 # -------- GUI --------
+@lru_cache(maxsize=None)
+def _tree_draw_classes():
+    """Import nltk's drawing widgets on the first tree view, not at startup."""
+    from nltk.draw.util import CanvasFrame
+    from nltk.draw import TreeWidget
+    return CanvasFrame, TreeWidget
+
+
+def _show_not_found(message):
+    from tkinter import messagebox  # only needed on the error path
+    messagebox.showerror("Not Found", message)
+
+
 class MewatiGUI:
+    # (label, handler method name, style tag, background colour), in display order
+    _BUTTONS = (
+        ("Morphological Features", "display_morpho", "Morph", "#ffefef"),
+        ("SpaCy Features", "display_spacy_analysis", "Spacy", "#e8ffe8"),
+        ("Leipzig Glossing", "display_gloss", "Gloss", "#e6f0ff"),
+        ("X-Bar Syntax Tree", "display_tree", "Tree", "#fff5e6"),
+        ("Clear Input", "clear_input", "Clear", "#f6eaff"),
+    )
+
     def __init__(self, master):
         self.root = master
         master.title("Mewati Language Model")
 
+        # Last raw input and its normalized form / tokens, reused across clicks
+        self._last_raw = None
+        self._last_norm = None
+        self._last_tokens = None
+
+        # Open table popups by (sentence, analysis); re-clicks raise them
+        self._popup_cache = {}
+
         # Title Label
         title_label = tk.Label(
             master,
@@ -728,30 +399,30 @@ class MewatiGUI:
         self.btn_frame = tk.Frame(master, bg="#f9f9f9")
         self.btn_frame.pack(pady=8)
 
-        self.buttons = {
-            "Morphological Features": {"cmd": self.display_morpho, "color": "#ffefef"},
-            "SpaCy Features": {"cmd": self.display_spacy_analysis, "color": "#e8ffe8"},
-            "Leipzig Glossing": {"cmd": self.display_gloss, "color": "#e6f0ff"},
-            "X-Bar Syntax Tree": {"cmd": self.display_tree, "color": "#fff5e6"},
-            "Clear Input": {"cmd": self.clear_input, "color": "#f6eaff"}
-        }
-
-        for text, opts in self.buttons.items():
-            b = tk.Button(
+        # Themed buttons share one style; each variant only sets its background.
+        # The "default" theme (also used by the popups) honours background colours.
+        style = ttk.Style()
+        style.theme_use("default")
+        style.configure(
+            "Mewati.TButton",
+            font=("Times New Roman", 10, "bold"),
+            foreground="black",
+            relief="groove",
+            padding=(12, 6)
+        )
+        for text, method, tag, color in self._BUTTONS:
+            style.configure(f"{tag}.Mewati.TButton", background=color)
+            b = ttk.Button(
                 self.btn_frame,
                 text=text,
-                command=lambda t=text, c=opts["cmd"]: self.run_with_status(t, c),
-                bg=opts["color"],
-                fg="black",
-                font=("Times New Roman", 10, "bold"),
-                relief="groove",
-                padx=12, pady=6
+                style=f"{tag}.Mewati.TButton",
+                command=partial(self.run_with_status, text, getattr(self, method))
             )
             b.pack(side=tk.LEFT, padx=6, pady=4)
 
     def run_with_status(self, button_text, func):
         self.root.config(cursor="watch")
-        self.root.update()
+        self.root.update_idletasks()  # repaint the cursor without pumping input events
         self.root.title(f"Searching: {button_text} ...")
         try:
             func()
@@ -760,48 +431,94 @@ class MewatiGUI:
             self.root.title("Mewati Language Model")
 
     def _get_input_sentence(self):
-        return normalize_sentence(self.text_entry.get())
+        raw = self.text_entry.get()
+        if raw != self._last_raw:
+            # Interned to match the interned SENTENCES keys
+            self._last_norm = sys.intern(normalize_sentence(raw))
+            self._last_tokens = tuple(self._last_norm.split())
+            self._last_raw = raw
+        return self._last_norm
+
+    def _get_input_tokens(self):
+        self._get_input_sentence()
+        return self._last_tokens
+
+    def _get_input_match(self):
+        """Input sentence plus the known key and entry it resolves to (see lookup())."""
+        sent = self._get_input_sentence()
+        return (sent,) + _match_sentence(sent)
+
+    def _raise_cached_popup(self, key):
+        top = self._popup_cache.get(key)
+        if top is None or not top.winfo_exists():
+            return False
+        top.deiconify()
+        top.lift()
+        top.focus_force()
+        return True
+
+    def _cache_popup(self, key, top):
+        self._popup_cache[key] = top
+
+        def forget(event):
+            # <Destroy> also fires for every child widget; only the popup counts
+            if event.widget is top:
+                self._popup_cache.pop(key, None)
+
+        top.bind("<Destroy>", forget, add="+")
 
     def display_morpho(self):
-        sent = self._get_input_sentence()
-        if sent not in MORPH_FEATURES:
-            messagebox.showerror("Not Found", f"No morphological features for:\n{sent}")
+        sent, key, entry = self._get_input_match()
+        rows = entry.morph if entry is not None else None
+        if rows is None:
+            _show_not_found(f"No morphological features for:\n{sent}")
+            return
+        if self._raise_cached_popup((key, "morpho")):
             return
-        rows = MORPH_FEATURES[sent]
         headers = ["Word", "Root", "Morph Structure", "Phonemic Change", "Explanation"]
-        show_table_popup(self.root, "Morphological Features", headers, rows)
+        top = show_table_popup(self.root, "Morphological Features", headers, rows)
+        self._cache_popup((key, "morpho"), top)
 
     def display_spacy_analysis(self):
-        sent = self._get_input_sentence()
-        if sent not in SPACY_FEATURES:
-            messagebox.showerror("Not Found", f"No SpaCy features for:\n{sent}")
+        sent, key, entry = self._get_input_match()
+        rows = entry.spacy if entry is not None else None
+        if rows is None:
+            _show_not_found(f"No SpaCy features for:\n{sent}")
+            return
+        if self._raise_cached_popup((key, "spacy")):
             return
-        rows = SPACY_FEATURES[sent]
         headers = ["Word", "Lemma", "POS", "Dependency", "Explanation", "Head"]
-        show_table_popup(self.root, "SpaCy Features", headers, rows)
+        top = show_table_popup(self.root, "SpaCy Features", headers, rows)
+        self._cache_popup((key, "spacy"), top)
 
     def display_gloss(self):
-        sent = self._get_input_sentence()
-        if sent not in LEIPZIG_ENTRIES:
-            messagebox.showerror("Not Found", f"No Leipzig glossing for:\n{sent}")
+        sent, key, entry = self._get_input_match()
+        gloss = entry.leipzig if entry is not None else None
+        if gloss is None:
+            _show_not_found(f"No Leipzig glossing for:\n{sent}")
+            return
+        if self._raise_cached_popup((key, "gloss")):
             return
-        entry = LEIPZIG_ENTRIES[sent]
 
         headers = ["Item", "Value", "Meaning"]
-        rows = [
-            ["Mewati Sentence", sent, ""],
-            ["Urdu Translation", entry["urdu"], ""],
-            ["English Translation", entry["english"], ""],
-            ["---", "---", "---"],
-            ["Word", "Gloss", "Meaning"]
-        ] + entry["words"]
+        rows = (
+            ("Mewati Sentence", key, ""),
+            ("Urdu Translation", gloss.urdu, ""),
+            ("English Translation", gloss.english, ""),
+            ("---", "---", "---"),
+            ("Word", "Gloss", "Meaning"),
+        ) + gloss.words
 
         # Mark the "Word | Gloss | Meaning" row as a special header
-        show_table_popup(self.root, "Leipzig Glossing", headers, rows, special_header_index=4)
+        top = show_table_popup(self.root, "Leipzig Glossing", headers, rows, special_header_index=4)
+        self._cache_popup((key, "gloss"), top)
 
     def display_tree(self):
-        sent = self._get_input_sentence()
-        tree = XBAR_TREES.get(sent, build_xbar_tree(sent.split()))
+        _, key, _ = self._get_input_match()
+        tree = _parsed_xbar_tree(key) if key is not None else None
+        if tree is None:
+            tokens = tuple(key.split()) if key is not None else self._get_input_tokens()
+            tree = build_xbar_tree(tokens)
 
         top = tk.Toplevel(self.root)
         top.title("X-Bar Syntax Tree")
@@ -817,6 +534,7 @@ class MewatiGUI:
         )
         lbl.pack(fill="x")
 
+        CanvasFrame, TreeWidget = _tree_draw_classes()
         cf = CanvasFrame(top, width=300, height=250, closeenough=2)
         t = TreeWidget(cf.canvas(), tree)
         cf.add_widget(t, 30, 30)
@@ -830,9 +548,7 @@ class MewatiGUI:
 if __name__ == "__main__":
     # GUI-only imports kept here so web environments without Tkinter still import data safely.
     import tkinter as tk
-    from tkinter import ttk, messagebox
-    from nltk.draw.util import CanvasFrame
-    from nltk.draw import TreeWidget
+    from tkinter import ttk
 
     root = tk.Tk()
     gui = MewatiGUI(root)
@@ -0,0 +1,27 @@
+import unittest
+
+from beauty_model_01 import predict_beauty_score, predict_beauty_scores
+
+
+class BatchScoreTest(unittest.TestCase):
+    def test_batch_matches_single_text_scores(self):
+        texts = [
+            "",
+            "   ",
+            "Hello World",
+            "  spaced \t out\ntext  ",
+            "AEIOU aeiou",
+            "یا کا منہ سو",
+            "café",
+            "a" * 5000,  # longer than the cache limit
+        ]
+        self.assertEqual(
+            predict_beauty_scores(texts), [predict_beauty_score(t) for t in texts]
+        )
+
+    def test_empty_batch(self):
+        self.assertEqual(predict_beauty_scores([]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
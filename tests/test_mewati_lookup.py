@@ -0,0 +1,28 @@
+import unittest
+
+import mewati_model
+
+
+class LookupTest(unittest.TestCase):
+    def test_exact_sentence(self):
+        key = "یا کا منہ سو"
+        self.assertIs(mewati_model.lookup(key + "۔"), mewati_model.SENTENCES[key])
+
+    def test_sentence_embedded_in_longer_input(self):
+        key = "یا کا منہ سو"
+        self.assertIs(
+            mewati_model.lookup("کچھ " + key + " اور"), mewati_model.SENTENCES[key]
+        )
+
+    def test_partial_words_do_not_match(self):
+        for text in (
+            "دنیا کا منہ سوال",     # not "یا کا منہ سو"
+            "ای جاڑان کی بات ایک",  # not "ای جاڑان کی بات ای"
+            "کپڑا کی لوگڑیاں",      # not "کپڑا کی لوگڑی"
+        ):
+            with self.subTest(text=text):
+                self.assertIsNone(mewati_model.lookup(text))
+
+
+if __name__ == "__main__":
+    unittest.main()